@@ -0,0 +1,41 @@
+"""
+This file defines helpers to evaluate variables over several years at once.
+
+Projections usually compute the same yearly variable (e.g. 'corporate_tax') for every year of a range.
+`calculate_over_years` returns a single 2-D array with one row per entity and one column per year.
+
+Each year is computed with `simulation.calculate`, so that the tracer, the cycle checks, reforms and
+the simulation cache all apply as usual. The tax and benefit system already caches the parameters
+of each instant, so they are resolved once per year whatever the number of variables using them.
+
+See https://openfisca.org/doc/key-concepts/simulation.html
+"""
+
+import numpy as np
+from openfisca_core import periods
+
+
+def years_between(first_year, last_year):
+    """Return the YEAR periods from `first_year` to `last_year`, both included."""
+    first_year = periods.period(first_year)
+    last_year = periods.period(last_year)
+    if any(year.unit != periods.YEAR or year.size != 1 for year in (first_year, last_year)):
+        raise ValueError(f"Expected YEAR periods, got '{first_year}' and '{last_year}'.")
+    if last_year.start.year < first_year.start.year:
+        raise ValueError(f"'{last_year}' is before '{first_year}'.")
+    return [first_year.offset(offset) for offset in range(last_year.start.year - first_year.start.year + 1)]
+
+
+def calculate_over_years(simulation, variable_name, first_year, last_year):
+    """
+    Calculate a YEAR variable from `first_year` to `last_year` (both included).
+
+    Returns a new array of shape (entity count, year count), which can be modified without
+    altering the simulation cache.
+    """
+    years = years_between(first_year, last_year)
+    variable = simulation.tax_benefit_system.get_variable(variable_name, check_existence = True)
+    if variable.definition_period != periods.YEAR:
+        raise ValueError(f"'{variable_name}' is not defined by YEAR.")
+
+    return np.stack([simulation.calculate(variable_name, year) for year in years], axis = 1)
@@ -0,0 +1,35 @@
+"""
+This file defines helpers to apply the tax scales of our legislation parameters.
+
+`MarginalRateTaxScale.calc` builds several (entity × bracket) arrays, which dominates the cost of
+formulas such as 'corporate_tax' on large populations. `calc_marginal_rate_tax_scale` gives the same
+values bracket by bracket, on arrays of the size of the population.
+
+See https://openfisca.org/doc/coding-the-legislation/legislation_parameters.html
+"""
+
+import numpy as np
+
+
+def calc_marginal_rate_tax_scale(tax_scale, tax_base):
+    """
+    Compute the tax amount for the given tax bases, as `tax_scale.calc(tax_base)` does.
+
+    The thresholds are scaled and compared in float64 exactly as in `MarginalRateTaxScale.calc`.
+    With a single taxed bracket, as in 'corporate_tax_rate', both return the same values; with several,
+    the sum of the brackets may differ in the last bit. Brackets with a zero rate add nothing and are skipped.
+    """
+    # To avoid 0 * inf, `MarginalRateTaxScale.calc` scales the thresholds by 1 + eps
+    thresholds = np.array([*tax_scale.thresholds, np.inf]) * (1 + np.finfo(np.float64).eps)
+    tax_base = tax_base.astype(np.float64)
+    tax = np.zeros(len(tax_base))
+    bracket_tax = np.empty(len(tax_base))
+    for lower, upper, rate in zip(thresholds[:-1], thresholds[1:], tax_scale.rates):
+        if rate == 0:
+            continue
+        np.minimum(tax_base, upper, out = bracket_tax)
+        bracket_tax -= lower
+        np.maximum(bracket_tax, 0, out = bracket_tax)
+        bracket_tax *= rate
+        tax += bracket_tax
+    return tax
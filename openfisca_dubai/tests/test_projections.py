@@ -0,0 +1,133 @@
+"""Tests of the multi-year evaluation helpers."""
+
+import numpy as np
+import pytest
+from openfisca_core.simulations import SimulationBuilder
+
+from openfisca_dubai import CountryTaxBenefitSystem
+from openfisca_dubai.projections import calculate_over_years, years_between
+
+
+tax_benefit_system = CountryTaxBenefitSystem()
+
+YEARS = [str(year) for year in range(2021, 2036)]
+
+
+def build_simulation():
+    return SimulationBuilder().build_from_entities(tax_benefit_system, {
+        "persons": {
+            "big_business": {
+                "taxable_income": {year: 4e6 + 1e5 * index for index, year in enumerate(YEARS)},
+                "revenue": {year: 5e6 for year in YEARS},
+                "tax_credits": {year: 1e5 for year in YEARS},
+                },
+            "small_business": {
+                "taxable_income": {year: 1e6 for year in YEARS},
+                "revenue": {year: 2e6 for year in YEARS},
+                },
+            "government": {
+                "taxable_income": {year: 4e6 for year in YEARS},
+                "revenue": {year: 5e6 for year in YEARS},
+                "is_government": {year: True for year in YEARS},
+                },
+            "pension_fund": {
+                "taxable_income": {year: 5e6 for year in YEARS},
+                "revenue": {year: 6e6 for year in YEARS},
+                "is_pension_fund": {year: True for year in YEARS},
+                },
+            "exempt_person": {
+                "taxable_income": {year: 5e6 for year in YEARS},
+                "revenue": {year: 6e6 for year in YEARS},
+                "exempt_person": {year: True for year in YEARS},
+                },
+            "small_business_threshold": {
+                "taxable_income": {year: 2e6 for year in YEARS},
+                "revenue": {year: 3e6 for year in YEARS},
+                },
+            "capped_tax_credits": {
+                "taxable_income": {year: 2.3456789e6 for year in YEARS},
+                "revenue": {year: 4e6 for year in YEARS},
+                "tax_credits": {year: 2e6 for year in YEARS},
+                },
+            },
+        })
+
+
+def test_years_between():
+    assert [str(year) for year in years_between("2023", "2025")] == ["2023", "2024", "2025"]
+
+
+@pytest.mark.parametrize("first_year, last_year", [("2025", "2023"), ("2024-01", "2025"), ("year:2024:2", "2027")])
+def test_years_between_rejects_invalid_range(first_year, last_year):
+    with pytest.raises(ValueError):
+        years_between(first_year, last_year)
+
+
+def test_corporate_tax_over_years():
+    simulation = build_simulation()
+    values = calculate_over_years(simulation, "corporate_tax", YEARS[0], YEARS[-1])
+
+    assert values.shape == (7, len(YEARS))
+    np.testing.assert_array_equal(values[:, 5], simulation.calculate("corporate_tax", YEARS[5]))
+    assert (values[:, :3] == 0).all()  # The corporate tax applies from 2023-06-01
+    assert values[0, 3] == pytest.approx(0.09 * (4.3e6 - 1e5 - 375000))
+    assert (values[1:6] == 0).all()  # Small businesses (revenue up to the threshold included) and exempt persons
+    assert values[6, 3] == pytest.approx(0.09 * (0.25 * 2.3456789e6 - 375000))  # Tax credits capped at 75 %
+
+
+def test_calculate_over_years_fills_simulation_cache():
+    simulation = build_simulation()
+    values = calculate_over_years(simulation, "corporate_tax", "2024", "2026")
+
+    np.testing.assert_array_equal(simulation.get_holder("corporate_tax").get_array("2025"), values[:, 1])
+
+
+def test_calculate_over_years_returns_a_copy():
+    simulation = build_simulation()
+    values = calculate_over_years(simulation, "corporate_tax", "2024", "2026")
+    expected = values[0, 1]
+
+    values[0, 1] = -1
+
+    assert simulation.calculate("corporate_tax", "2025")[0] == expected
+
+
+def test_calculate_over_years_keeps_known_values():
+    simulation = build_simulation()
+    simulation.set_input("corporate_tax", "2025", np.arange(7.0))
+
+    values = calculate_over_years(simulation, "corporate_tax", "2024", "2026")
+
+    np.testing.assert_array_equal(values[:, 1], np.arange(7.0))
+
+
+def test_calculate_over_years_is_traced():
+    simulation = build_simulation()
+    simulation.trace = True
+
+    calculate_over_years(simulation, "corporate_tax", "2024", "2026")
+
+    assert [str(node.period) for node in simulation.tracer.trees if node.name == "corporate_tax"] == ["2024", "2025", "2026"]
+
+
+def test_taxable_income_over_years_for_several_persons():
+    simulation = SimulationBuilder().build_from_entities(tax_benefit_system, {
+        "persons": {
+            "low_interest": {"EBITDA": {"2021": 180e6, "2022": 180e6}, "interest_expense": {"2021": 80e6, "2022": 80e6}, "interest_income": {"2021": 60e6, "2022": 60e6}},
+            "high_interest": {"EBITDA": {"2021": 200e6, "2022": 200e6}, "interest_expense": {"2021": 100e6, "2022": 100e6}, "interest_income": {"2021": 10e6, "2022": 10e6}},
+            "tax_credits": {"EBITDA": {"2021": 100e6, "2022": 100e6}, "tax_credits": {"2021": 90e6, "2022": 10e6}},
+            },
+        })
+
+    values = calculate_over_years(simulation, "taxable_income", "2021", "2022")
+
+    np.testing.assert_array_equal(values, [[160e6, 160e6], [140e6, 140e6], [25e6, 90e6]])
+
+
+def test_corporate_tax_does_not_alter_taxable_income():
+    simulation = build_simulation()
+    taxable_income = simulation.calculate("taxable_income", "2024").copy()
+
+    simulation.calculate("corporate_tax", "2024")
+
+    np.testing.assert_array_equal(simulation.calculate("taxable_income", "2024"), taxable_income)
@@ -0,0 +1,44 @@
+"""Tests of the tax scale helpers."""
+
+import numpy as np
+import pytest
+from openfisca_core.taxscales import MarginalRateTaxScale
+
+from openfisca_dubai import CountryTaxBenefitSystem
+from openfisca_dubai.taxscales import calc_marginal_rate_tax_scale
+
+
+tax_benefit_system = CountryTaxBenefitSystem()
+
+
+def test_calc_marginal_rate_tax_scale():
+    tax_scale = MarginalRateTaxScale()
+    tax_scale.add_bracket(0, 0)
+    tax_scale.add_bracket(100, 0.1)
+
+    assert calc_marginal_rate_tax_scale(tax_scale, np.array([0, 150])) == pytest.approx([0, 5])
+
+
+def test_calc_marginal_rate_tax_scale_without_brackets():
+    np.testing.assert_array_equal(calc_marginal_rate_tax_scale(MarginalRateTaxScale(), np.array([0, 150])), [0, 0])
+
+
+@pytest.mark.parametrize("year", ["2023", "2024"])
+def test_calc_marginal_rate_tax_scale_matches_calc(year):
+    tax_scale = tax_benefit_system.parameters(year).taxes.corporate_tax_rate
+    tax_base = np.random.default_rng(0).uniform(-1e6, 2e7, 100000).astype(np.float32)
+    tax_base[:3] = [0, 375000, 375001]
+
+    np.testing.assert_array_equal(calc_marginal_rate_tax_scale(tax_scale, tax_base), tax_scale.calc(tax_base))
+
+
+def test_calc_marginal_rate_tax_scale_matches_calc_with_several_rates():
+    tax_scale = MarginalRateTaxScale()
+    tax_scale.add_bracket(0, 0.01)
+    tax_scale.add_bracket(1000.5, 0.13)
+    tax_scale.add_bracket(2e5, 0)
+    tax_scale.add_bracket(3e5, 0.37)
+    tax_base = np.random.default_rng(0).uniform(-1e3, 1e6, 100000)
+
+    # `calc` sums the brackets with a dot product, whose rounding may differ in the last bit
+    np.testing.assert_allclose(calc_marginal_rate_tax_scale(tax_scale, tax_base), tax_scale.calc(tax_base), rtol = 1e-12)
@@ -14,6 +14,7 @@ from openfisca_core.variables import Variable
 # Import the Entities specifically defined for this tax and benefit system
 from openfisca_core import holders, periods, variables
 from openfisca_dubai import entities
+from openfisca_dubai.taxscales import calc_marginal_rate_tax_scale
 
 import numpy as np
 
@@ -49,8 +50,9 @@ class corporate_tax(Variable):
             tax_credits = 0
 
         max_tax_credits = parameters(period).taxes.max_tax_credits * taxable_income
-        actual_tax_credits = min(tax_credits, max_tax_credits)
-        taxable_income -= actual_tax_credits
+        actual_tax_credits = np.minimum(tax_credits, max_tax_credits)
+        # Do not subtract in place: `taxable_income` is the array cached by the simulation
+        taxable_income = taxable_income - actual_tax_credits
 
         is_exempt = (
             np.logical_not(is_government)
@@ -59,7 +61,7 @@ class corporate_tax(Variable):
             * np.logical_not(is_pension_fund)
         )
 
-        tax_payable = corporate_tax_rate.calc(taxable_income)
+        tax_payable = calc_marginal_rate_tax_scale(corporate_tax_rate, taxable_income)
 
         return tax_payable * is_exempt
 
@@ -84,9 +86,9 @@ class taxable_income(Variable):
         carry_forward_interest = person("carry_forward_interest", period)
 
         net_interest = interest_expense - interest_income
-        max_interest_deduction = max(0.3 * ebitda, 12000000)
-        net_interest = min(net_interest, max_interest_deduction)
-        carry_forward_interest = min(
+        max_interest_deduction = np.maximum(0.3 * ebitda, 12000000)
+        net_interest = np.minimum(net_interest, max_interest_deduction)
+        carry_forward_interest = np.minimum(
             carry_forward_interest, 0.3 * ebitda - net_interest
         )
         net_interest += carry_forward_interest
@@ -96,7 +98,7 @@ class taxable_income(Variable):
         taxable_income -= amortization
 
         max_tax_credits = 0.75 * taxable_income
-        actual_tax_credits = min(tax_credits, max_tax_credits)
+        actual_tax_credits = np.minimum(tax_credits, max_tax_credits)
         taxable_income -= actual_tax_credits
 
         return taxable_income
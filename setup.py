@@ -10,7 +10,7 @@ long_description = (this_directory / "README.md").read_text()  # pylint: disable
 
 setup(
     name = "OpenFisca-Dubai",
-    version = "6.0.3",
+    version = "6.1.0",
     author = "OpenFisca Team",
     author_email = "contact@openfisca.org",
     classifiers = [